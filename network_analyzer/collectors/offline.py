@@ -1,22 +1,37 @@
 """Offline network data collection (no internet required)."""
 
 import re
-from typing import Optional
-from network_analyzer.utils import execute_command, is_wifi_interface
+import math
+import socket
+import asyncio
+import statistics
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from ipaddress import ip_address
+from typing import Callable, Optional
+import psutil
+from network_analyzer.utils import (
+    AIRPORT_PATH,
+    execute_command,
+    execute_cached_command,
+    get_wifi_snapshot,
+    is_wifi_interface,
+    resolve_executable
+)
 from network_analyzer.models import (
     InterfaceInfo,
     NetworkMetrics,
     WiFiInfo,
     PingResult,
-    NetworkScan
+    NetworkScan,
+    OfflineSnapshot
 )
-from network_analyzer.parsers.ifconfig import parse_ifconfig, parse_all_interfaces
+from network_analyzer.parsers.ifconfig import parse_ifconfig_all
 from network_analyzer.parsers.netstat import (
     parse_netstat_interface,
     parse_routing_table,
     get_default_gateway
 )
-from network_analyzer.parsers.airport import parse_airport_info, parse_airport_scan
+from network_analyzer.parsers.airport import parse_airport_scan, wifi_info_from_fields
 from network_analyzer.parsers.system_profiler import (
     parse_hardware_port_mapping,
     parse_dns_servers
@@ -26,6 +41,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_ARP_RE = re.compile(r'(\S+)\s+\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-f:]+)\s+on\s+(\w+)')
+_PING_TIME_RE = re.compile(rb'time=([\d.]+)')
+
+# Loopback and some virtual interfaces
+_SKIPPED_INTERFACE_PREFIXES = ('lo', 'gif', 'stf', 'fw')
+
 
 def get_all_interfaces() -> list[InterfaceInfo]:
     """Get all network interfaces with their details.
@@ -37,25 +58,22 @@ def get_all_interfaces() -> list[InterfaceInfo]:
 
     try:
         # Get hardware port mapping
-        stdout, _, _ = execute_command(
+        stdout, _, _ = execute_cached_command(
             ["networksetup", "-listallhardwareports"],
+            ttl=30,
             timeout=10
         )
         port_mapping = parse_hardware_port_mapping(stdout)
 
         # Get all interface details
         stdout, _, _ = execute_command(["ifconfig", "-a"], timeout=10)
-        interface_names = parse_all_interfaces(stdout)
 
-        for name in interface_names:
-            # Skip loopback and some virtual interfaces
-            if name.startswith(('lo', 'gif', 'stf', 'fw')):
+        for name, info in parse_ifconfig_all(stdout).items():
+            if name.startswith(_SKIPPED_INTERFACE_PREFIXES):
                 continue
 
-            info = parse_ifconfig(stdout, name)
-            if info:
-                info.hardware_port = port_mapping.get(name, "Unknown")
-                interfaces.append(info)
+            info.hardware_port = port_mapping.get(name, "Unknown")
+            interfaces.append(info)
 
     except Exception as e:
         logger.error(f"Failed to get interfaces: {e}")
@@ -73,6 +91,22 @@ def get_interface_metrics(interface: str) -> Optional[NetworkMetrics]:
         NetworkMetrics object or None
     """
     try:
+        # Kernel counters, no subprocess needed. psutil doesn't expose
+        # collisions, so they stay 0 on this path and only the netstat
+        # fallback reports them.
+        counters = psutil.net_io_counters(pernic=True).get(interface)
+        if counters:
+            return NetworkMetrics(
+                interface=interface,
+                packets_in=counters.packets_recv,
+                packets_out=counters.packets_sent,
+                errors_in=counters.errin,
+                errors_out=counters.errout,
+                bytes_in=counters.bytes_recv,
+                bytes_out=counters.bytes_sent
+            )
+
+        # Fall back to netstat for interfaces psutil doesn't report
         stdout, _, _ = execute_command(
             ["netstat", "-I", interface, "-b"],
             timeout=10
@@ -95,20 +129,8 @@ def get_wifi_info(interface: str) -> Optional[WiFiInfo]:
     if not is_wifi_interface(interface):
         return None
 
-    try:
-        airport_cmd = [
-            "/System/Library/PrivateFrameworks/Apple80211.framework/"
-            "Versions/Current/Resources/airport",
-            "-I"
-        ]
-        stdout, _, code = execute_command(airport_cmd, timeout=10)
-
-        if code == 0:
-            return parse_airport_info(stdout)
-    except Exception as e:
-        logger.error(f"Failed to get WiFi info: {e}")
-
-    return None
+    # Reuses the airport run from the WiFi check above
+    return wifi_info_from_fields(get_wifi_snapshot(interface))
 
 
 def get_wifi_scan() -> list[NetworkScan]:
@@ -118,12 +140,7 @@ def get_wifi_scan() -> list[NetworkScan]:
         List of NetworkScan objects
     """
     try:
-        airport_cmd = [
-            "/System/Library/PrivateFrameworks/Apple80211.framework/"
-            "Versions/Current/Resources/airport",
-            "-s"
-        ]
-        stdout, _, code = execute_command(airport_cmd, timeout=30)
+        stdout, _, code = execute_command([AIRPORT_PATH, "-s"], timeout=30)
 
         if code == 0:
             return parse_airport_scan(stdout)
@@ -157,7 +174,7 @@ def get_dns_servers() -> list[str]:
         List of DNS server IPs
     """
     try:
-        stdout, _, _ = execute_command(["scutil", "--dns"], timeout=10)
+        stdout, _, _ = execute_cached_command(["scutil", "--dns"], ttl=30, timeout=10)
         return parse_dns_servers(stdout)
     except Exception as e:
         logger.error(f"Failed to get DNS servers: {e}")
@@ -171,97 +188,171 @@ def get_arp_cache() -> list[dict]:
         List of ARP entries
     """
     try:
-        stdout, _, _ = execute_command(["arp", "-a"], timeout=10)
-        entries = []
+        stdout, _, _ = execute_cached_command(["arp", "-a"], ttl=5, timeout=10)
 
         # Parse format: hostname (ip) at mac on interface
-        pattern = r'(\S+)\s+\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-f:]+)\s+on\s+(\w+)'
-        for match in re.finditer(pattern, stdout):
-            entries.append({
-                'hostname': match.group(1),
-                'ip': match.group(2),
-                'mac': match.group(3),
-                'interface': match.group(4)
-            })
-
-        return entries
+        return [
+            {'hostname': hostname, 'ip': ip, 'mac': mac, 'interface': interface}
+            for hostname, ip, mac, interface in _ARP_RE.findall(stdout)
+        ]
     except Exception as e:
         logger.error(f"Failed to get ARP cache: {e}")
         return []
 
 
-def run_ping_test(host: str, count: int = 10) -> Optional[PingResult]:
-    """Run ping test to measure latency and packet loss.
+async def run_ping_test_async(
+    host: str,
+    count: int = 10,
+    interval: float = 0.2,
+    stop_on_timeout: bool = False
+) -> Optional[PingResult]:
+    """Run ping test, collecting round-trip times as replies arrive.
 
     Args:
         host: Hostname or IP to ping
         count: Number of pings
+        interval: Seconds between pings
+        stop_on_timeout: Stop at the first lost packet (quick liveness check)
 
     Returns:
         PingResult object or None on failure
     """
+    # Bound ping itself: time to send every packet plus 2s for the last reply.
+    # Without -t, ping waits up to 10s after the last packet when all are lost.
+    deadline = math.ceil(count * interval) + 2
+
     try:
-        stdout, _, code = execute_command(
-            ["ping", "-c", str(count), host],
-            timeout=count + 10
+        process = await asyncio.create_subprocess_exec(
+            resolve_executable("ping"), "-i", str(interval), "-c", str(count),
+            "-t", str(deadline), host,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False
         )
-
-        if code != 0:
+        # Always set, since stdout is a pipe
+        assert process.stdout is not None
+
+        rtts: list[float] = []
+        lost = 0
+        stopped_early = False
+
+        try:
+            # Safety net in case ping doesn't honour its own deadline
+            async with asyncio.timeout(deadline + 5):
+                # Format: "64 bytes from 8.8.8.8: icmp_seq=0 ttl=117 time=12.345 ms"
+                async for line in process.stdout:
+                    # Duplicate replies don't mean another packet got through
+                    if b'(DUP!)' in line:
+                        continue
+                    rtt_match = _PING_TIME_RE.search(line)
+                    if rtt_match:
+                        rtts.append(float(rtt_match.group(1)))
+                    elif line.startswith(b'Request timeout'):
+                        lost += 1
+                        if stop_on_timeout:
+                            stopped_early = True
+                            break
+                await process.wait()
+        except TimeoutError:
+            # Keep what was collected; unanswered packets count as lost
+            logger.warning(f"Ping to {host} did not finish within {deadline + 5}s")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        packets_sent = len(rtts) + lost if stopped_early else count
+        packets_received = len(rtts)
+
+        if not rtts:
             return PingResult(
                 host=host,
-                packets_sent=count,
+                packets_sent=packets_sent,
                 packets_received=0,
                 packet_loss=100.0
             )
 
-        # Parse statistics
-        # Format: "10 packets transmitted, 8 packets received, 20.0% packet loss"
-        stats_match = re.search(
-            r'(\d+) packets transmitted, (\d+) (?:packets )?received, ([\d.]+)% packet loss',
-            stdout
+        return PingResult(
+            host=host,
+            packets_sent=packets_sent,
+            packets_received=packets_received,
+            packet_loss=max(packets_sent - packets_received, 0) / packets_sent * 100,
+            min_rtt=min(rtts),
+            avg_rtt=statistics.fmean(rtts),
+            max_rtt=max(rtts),
+            stddev_rtt=statistics.pstdev(rtts)
         )
 
-        if not stats_match:
-            return None
+    except Exception as e:
+        logger.error(f"Failed to ping {host}: {e}")
+        return None
 
-        packets_sent = int(stats_match.group(1))
-        packets_received = int(stats_match.group(2))
-        packet_loss = float(stats_match.group(3))
 
-        # Parse RTT statistics
-        # Format: "round-trip min/avg/max/stddev = 12.345/23.456/34.567/5.678 ms"
-        rtt_match = re.search(
-            r'round-trip min/avg/max/(?:std-dev|stddev) = ([\d.]+)/([\d.]+)/([\d.]+)/([\d.]+)',
-            stdout
-        )
+def run_ping_test(host: str, count: int = 10, interval: float = 0.2) -> Optional[PingResult]:
+    """Run ping test to measure latency and packet loss.
 
-        if rtt_match:
-            return PingResult(
-                host=host,
-                packets_sent=packets_sent,
-                packets_received=packets_received,
-                packet_loss=packet_loss,
-                min_rtt=float(rtt_match.group(1)),
-                avg_rtt=float(rtt_match.group(2)),
-                max_rtt=float(rtt_match.group(3)),
-                stddev_rtt=float(rtt_match.group(4))
-            )
-        else:
-            return PingResult(
-                host=host,
-                packets_sent=packets_sent,
-                packets_received=packets_received,
-                packet_loss=packet_loss
-            )
+    Args:
+        host: Hostname or IP to ping
+        count: Number of pings
+        interval: Seconds between pings
 
-    except Exception as e:
-        logger.error(f"Failed to ping {host}: {e}")
-        return None
+    Returns:
+        PingResult object or None on failure
+    """
+    return asyncio.run(run_ping_test_async(host, count, interval))
 
 
-def get_active_connections() -> list[dict]:
+def get_active_connections(limit: int = 50) -> list[dict]:
     """Get active network connections.
 
+    Args:
+        limit: Maximum number of entries to return
+
+    Returns:
+        List of connection entries
+    """
+    try:
+        connections = []
+        processes = {}
+
+        for conn in psutil.net_connections(kind='inet'):
+            if conn.pid is None:
+                continue
+
+            # Resolve each process only once
+            if conn.pid not in processes:
+                try:
+                    process = psutil.Process(conn.pid)
+                    processes[conn.pid] = (process.name(), process.username())
+                except psutil.Error:
+                    processes[conn.pid] = ('', '')
+            command, user = processes[conn.pid]
+
+            connections.append({
+                'command': command,
+                'pid': str(conn.pid),
+                'user': user,
+                'protocol': 'TCP' if conn.type == socket.SOCK_STREAM else 'UDP',
+                'state': f"({conn.status})" if conn.status != psutil.CONN_NONE else ''
+            })
+            if len(connections) >= limit:
+                break
+
+        return connections
+    except psutil.AccessDenied:
+        # macOS only exposes other processes' sockets to root
+        return _get_active_connections_lsof(limit)
+    except Exception as e:
+        logger.error(f"Failed to get active connections: {e}")
+        return []
+
+
+def _get_active_connections_lsof(limit: int) -> list[dict]:
+    """Get active network connections by parsing lsof output.
+
+    Args:
+        limit: Maximum number of entries to return
+
     Returns:
         List of connection entries
     """
@@ -272,10 +363,11 @@ def get_active_connections() -> list[dict]:
         )
 
         connections = []
-        lines = stdout.strip().split('\n')
+        lines = iter(stdout.splitlines())
 
         # Skip header
-        for line in lines[1:]:
+        next(lines, None)
+        for line in lines:
             parts = line.split()
             if len(parts) >= 9:
                 connections.append({
@@ -285,8 +377,10 @@ def get_active_connections() -> list[dict]:
                     'protocol': parts[7] if len(parts) > 7 else '',
                     'state': parts[9] if len(parts) > 9 else ''
                 })
+                if len(connections) >= limit:
+                    break
 
-        return connections[:50]  # Limit to 50 entries
+        return connections
     except Exception as e:
         logger.error(f"Failed to get active connections: {e}")
         return []
@@ -315,6 +409,22 @@ def get_dhcp_info(interface: str) -> Optional[dict]:
     return None
 
 
+def _is_local_address(address: str) -> bool:
+    """Check if an address is loopback, link-local or unspecified.
+
+    Args:
+        address: IP address string
+
+    Returns:
+        True if the address is local, False otherwise (including unparsable strings)
+    """
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return ip.is_loopback or ip.is_link_local or ip.is_unspecified
+
+
 def get_network_dns_servers(interface: str) -> list[str]:
     """Get actual network DNS servers (from DHCP or network config).
 
@@ -338,14 +448,11 @@ def get_network_dns_servers(interface: str) -> list[str]:
 
     # Fallback to scutil DNS (but filter out local ones)
     try:
-        stdout, _, _ = execute_command(["scutil", "--dns"], timeout=10)
+        stdout, _, _ = execute_cached_command(["scutil", "--dns"], ttl=30, timeout=10)
         all_dns = parse_dns_servers(stdout)
 
-        # Filter out local DNS servers (127.x.x.x, ::1, etc.)
-        dns_servers = [
-            dns for dns in all_dns
-            if not dns.startswith('127.') and dns != '::1'
-        ]
+        # Filter out local DNS servers (127.x.x.x, ::1, 169.254.x.x, etc.)
+        dns_servers = [dns for dns in all_dns if not _is_local_address(dns)]
 
         if dns_servers:
             logger.info(f"Got DNS servers from scutil: {dns_servers}")
@@ -354,3 +461,60 @@ def get_network_dns_servers(interface: str) -> list[str]:
         logger.error(f"Failed to get DNS servers: {e}")
 
     return dns_servers
+
+
+def collect_all(include_wifi_scan: bool = True, max_workers: int = 8) -> OfflineSnapshot:
+    """Run all offline collectors concurrently.
+
+    Every collector wraps an independent command, so running them on a
+    thread pool brings wall time down to roughly that of the slowest one.
+    Per-interface collectors are submitted as soon as the interface list
+    is available.
+
+    Args:
+        include_wifi_scan: Whether to scan for nearby WiFi networks
+        max_workers: Maximum number of concurrent commands
+
+    Returns:
+        OfflineSnapshot with all collected data
+    """
+    snapshot = OfflineSnapshot()
+
+    collectors = [
+        ('interfaces', get_all_interfaces),
+        ('routing', get_routing_info),
+        ('dns_servers', get_dns_servers),
+        ('arp_cache', get_arp_cache),
+        ('connections', get_active_connections)
+    ]
+    if include_wifi_scan:
+        collectors.append(('wifi_scan', get_wifi_scan))
+
+    per_interface_collectors: list[tuple[str, Callable[[str], object]]] = [
+        ('metrics', get_interface_metrics),
+        ('dhcp_info', get_dhcp_info)
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func): attr for attr, func in collectors}
+        interface_futures: dict[Future[object], tuple[str, str]] = {}
+
+        for future in as_completed(futures):
+            attr = futures[future]
+            setattr(snapshot, attr, future.result())
+
+            if attr == 'interfaces':
+                for info in snapshot.interfaces:
+                    for field_name, func in per_interface_collectors:
+                        interface_futures[executor.submit(func, info.name)] = (field_name, info.name)
+
+                    # airport -I only describes the WiFi port, so don't attach
+                    # its output to every other interface
+                    if info.hardware_port == "Wi-Fi":
+                        interface_futures[executor.submit(get_wifi_info, info.name)] = ('wifi_info', info.name)
+
+        for interface_future in as_completed(interface_futures):
+            field_name, interface = interface_futures[interface_future]
+            getattr(snapshot, field_name)[interface] = interface_future.result()
+
+    return snapshot
@@ -373,8 +373,9 @@ def check_reachability(host: str) -> bool:
     try:
         stdout, _, code = execute_command(
             ["scutil", "-r", host],
-            timeout=5
+            timeout=5,
+            text=False
         )
-        return code == 0 and "Reachable" in stdout
+        return code == 0 and b"Reachable" in stdout
     except Exception:
         return False
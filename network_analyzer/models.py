@@ -132,3 +132,17 @@ class NetworkScan:
     channel: int
     rssi: int
     security: str
+
+
+@dataclass
+class OfflineSnapshot:
+    """Combined results of a full offline data collection."""
+    interfaces: list[InterfaceInfo] = field(default_factory=list)
+    routing: dict = field(default_factory=dict)
+    dns_servers: list[str] = field(default_factory=list)
+    arp_cache: list[dict] = field(default_factory=list)
+    connections: list[dict] = field(default_factory=list)
+    wifi_scan: list[NetworkScan] = field(default_factory=list)
+    metrics: dict[str, Optional[NetworkMetrics]] = field(default_factory=dict)
+    wifi_info: dict[str, Optional[WiFiInfo]] = field(default_factory=dict)
+    dhcp_info: dict[str, Optional[dict]] = field(default_factory=dict)
@@ -4,6 +4,18 @@ import re
 from typing import Optional
 from network_analyzer.models import WiFiInfo, NetworkScan
 
+_NON_NUMERIC_RE = re.compile(r'[^\d-]')
+
+
+def _to_int(value: Optional[str], default: int = 0) -> int:
+    """Convert an airport field value to int, ignoring non-numeric characters."""
+    if value:
+        try:
+            return int(_NON_NUMERIC_RE.sub('', value))
+        except ValueError:
+            pass
+    return default
+
 
 def parse_airport_info(output: str) -> Optional[WiFiInfo]:
     """Parse airport -I command output.
@@ -17,43 +29,54 @@ def parse_airport_info(output: str) -> Optional[WiFiInfo]:
     if not output or "AirPort: Off" in output:
         return None
 
-    def extract_value(key: str, default=None):
-        """Extract value for a key from output."""
-        pattern = rf'{key}:\s*(.+)'
-        match = re.search(pattern, output)
-        return match.group(1).strip() if match else default
+    return wifi_info_from_fields(parse_airport_fields(output))
 
-    def extract_int(key: str, default: int = 0) -> int:
-        """Extract integer value."""
-        value = extract_value(key)
-        if value:
-            try:
-                # Remove any non-numeric characters except minus
-                value = re.sub(r'[^\d-]', '', value)
-                return int(value)
-            except ValueError:
-                pass
-        return default
-
-    ssid = extract_value('SSID', '')
+
+def parse_airport_fields(output: str) -> dict[str, str]:
+    """Split airport -I command output into its fields.
+
+    Args:
+        output: airport -I command output
+
+    Returns:
+        Dictionary mapping field names (e.g. 'agrCtlRSSI') to values
+    """
+    # Output is one "key: value" pair per line
+    fields = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(':')
+        fields[key.strip()] = value.strip()
+    return fields
+
+
+def wifi_info_from_fields(fields: dict[str, str]) -> Optional[WiFiInfo]:
+    """Build WiFi connection info from parsed airport -I fields.
+
+    Args:
+        fields: Fields as returned by parse_airport_fields
+
+    Returns:
+        WiFiInfo object or None if not connected
+    """
+    ssid = fields.get('SSID', '')
     if not ssid:
         return None
 
-    rssi = extract_int('agrCtlRSSI', 0)
-    noise = extract_int('agrCtlNoise', 0)
+    rssi = _to_int(fields.get('agrCtlRSSI'), 0)
+    noise = _to_int(fields.get('agrCtlNoise'), 0)
 
     return WiFiInfo(
         ssid=ssid,
-        bssid=extract_value('BSSID', ''),
-        channel=extract_int('channel', 0),
+        bssid=fields.get('BSSID', ''),
+        channel=_to_int(fields.get('channel'), 0),
         rssi=rssi,
         noise=noise,
         snr=rssi - noise,
-        tx_rate=extract_int('lastTxRate', 0),
-        mcs_index=extract_int('MCS', -1),
-        phy_mode=extract_value('PHY Mode', ''),
-        security=extract_value('link auth', ''),
-        channel_width=extract_int('channelWidth', 0)
+        tx_rate=_to_int(fields.get('lastTxRate'), 0),
+        mcs_index=_to_int(fields.get('MCS'), -1),
+        phy_mode=fields.get('PHY Mode', ''),
+        security=fields.get('link auth', ''),
+        channel_width=_to_int(fields.get('channelWidth'), 0)
     )
 
 
@@ -67,12 +90,14 @@ def parse_airport_scan(output: str) -> list[NetworkScan]:
         List of NetworkScan objects
     """
     networks = []
-    lines = output.strip().split('\n')
+    lines = iter(output.splitlines())
 
     # Skip header line
-    for line in lines[1:]:
-        parts = line.split()
-        if len(parts) >= 7:
+    next(lines, None)
+    for line in lines:
+        # Stop splitting at the security column, which may contain spaces
+        parts = line.split(None, 6)
+        if len(parts) == 7:
             try:
                 # Format: SSID BSSID RSSI CHANNEL HT CC SECURITY
                 ssid = parts[0]
@@ -81,7 +106,7 @@ def parse_airport_scan(output: str) -> list[NetworkScan]:
                 channel = int(parts[3])
 
                 # Security is everything after channel info
-                security = ' '.join(parts[6:]) if len(parts) > 6 else ''
+                security = parts[6].rstrip()
 
                 networks.append(NetworkScan(
                     ssid=ssid,
@@ -3,6 +3,69 @@
 import re
 from typing import Optional
 
+_IPV4_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+
+
+def _parse_ip_list(value: str) -> list[str]:
+    """Parse an ip_mult value like '{1.2.3.4, 5.6.7.8}'."""
+    if value.startswith('{') and value.endswith('}') and len(value) > 2:
+        return [ip.strip() for ip in value[1:-1].split(',')]
+    return []
+
+
+def _set_server(info: dict, value: str):
+    """Set DHCP server from server_identifier."""
+    match = _IPV4_RE.match(value)
+    if match:
+        info['server'] = match.group(0)
+
+
+def _set_router(info: dict, value: str):
+    """Set gateway from the first router entry."""
+    routers = _parse_ip_list(value)
+    if routers:
+        info['router'] = routers[0]
+
+
+def _set_dns_servers(info: dict, value: str):
+    """Set DNS servers from domain_name_server."""
+    dns_servers = _parse_ip_list(value)
+    if dns_servers:
+        info['dns_servers'] = dns_servers
+
+
+def _set_domain_name(info: dict, value: str):
+    """Set domain name."""
+    if value:
+        info['domain_name'] = value
+
+
+def _set_subnet_mask(info: dict, value: str):
+    """Set subnet mask."""
+    match = _IPV4_RE.match(value)
+    if match:
+        info['subnet_mask'] = match.group(0)
+
+
+def _set_lease_time(info: dict, value: str):
+    """Set lease time, converting hex to seconds."""
+    if value.startswith('0x'):
+        try:
+            info['lease_time'] = int(value[2:], 16)
+        except ValueError:
+            pass
+
+
+# Option name -> setter, for lines like "router (ip_mult): {192.168.1.1}"
+_OPTION_SETTERS = {
+    'server_identifier': _set_server,
+    'router': _set_router,
+    'domain_name_server': _set_dns_servers,
+    'domain_name': _set_domain_name,
+    'subnet_mask': _set_subnet_mask,
+    'lease_time': _set_lease_time
+}
+
 
 def parse_dhcp_info(output: str) -> Optional[dict]:
     """Parse ipconfig getpacket output for DHCP information.
@@ -26,37 +89,12 @@ def parse_dhcp_info(output: str) -> Optional[dict]:
         'subnet_mask': None
     }
 
-    # Extract DHCP server (server_identifier)
-    server_match = re.search(r'server_identifier \(ip\):\s*(\d+\.\d+\.\d+\.\d+)', output)
-    if server_match:
-        info['server'] = server_match.group(1)
-
-    # Extract router/gateway
-    router_match = re.search(r'router \(ip_mult\):\s*\{([^}]+)\}', output)
-    if router_match:
-        routers = router_match.group(1).split(',')
-        info['router'] = routers[0].strip() if routers else None
-
-    # Extract DNS servers
-    dns_match = re.search(r'domain_name_server \(ip_mult\):\s*\{([^}]+)\}', output)
-    if dns_match:
-        dns_servers = [ip.strip() for ip in dns_match.group(1).split(',')]
-        info['dns_servers'] = dns_servers
-
-    # Extract domain name
-    domain_match = re.search(r'domain_name \(string\):\s*(.+)', output)
-    if domain_match:
-        info['domain_name'] = domain_match.group(1).strip()
-
-    # Extract subnet mask
-    mask_match = re.search(r'subnet_mask \(ip\):\s*(\d+\.\d+\.\d+\.\d+)', output)
-    if mask_match:
-        info['subnet_mask'] = mask_match.group(1)
-
-    # Extract lease time (hex to seconds)
-    lease_match = re.search(r'lease_time \(uint32\):\s*0x([0-9a-fA-F]+)', output)
-    if lease_match:
-        info['lease_time'] = int(lease_match.group(1), 16)
+    # Single pass over the options, dispatching on the option name
+    for line in output.splitlines():
+        option, _, value = line.partition(':')
+        setter = _OPTION_SETTERS.get(option.split(' (', 1)[0].strip())
+        if setter:
+            setter(info, value.strip())
 
     return info
 
@@ -1,9 +1,18 @@
 """Parser for ifconfig command output."""
 
 import re
+import socket
 from typing import Optional
 from network_analyzer.models import InterfaceInfo
 
+_MAC_RE = re.compile(r'ether\s+([0-9a-f:]+)', re.IGNORECASE)
+_IPV4_RE = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+)\s+netmask\s+0x([0-9a-f]+)')
+_IPV6_RE = re.compile(r'inet6\s+([0-9a-f:]+)', re.IGNORECASE)
+_STATUS_RE = re.compile(r'status:\s+(\w+)')
+_MEDIA_RE = re.compile(r'media:\s+([^\n]+)')
+_MTU_RE = re.compile(r'mtu\s+(\d+)')
+_INTERFACE_HEADER_RE = re.compile(r'(\w+\d*):\s+flags=')
+
 
 def parse_ifconfig(output: str, interface_name: str) -> Optional[InterfaceInfo]:
     """Parse ifconfig output for a specific interface.
@@ -16,7 +25,7 @@ def parse_ifconfig(output: str, interface_name: str) -> Optional[InterfaceInfo]:
         InterfaceInfo object or None if not found
     """
     # Find the interface block - match from interface name to next interface or end
-    lines = output.split('\n')
+    lines = output.splitlines()
     block_lines = []
     in_block = False
 
@@ -35,35 +44,80 @@ def parse_ifconfig(output: str, interface_name: str) -> Optional[InterfaceInfo]:
     if not block_lines:
         return None
 
-    block = '\n'.join(block_lines)
+    return _parse_block(interface_name, '\n'.join(block_lines))
+
+
+def parse_ifconfig_all(output: str) -> dict[str, InterfaceInfo]:
+    """Parse every interface block from ifconfig output in a single pass.
+
+    Args:
+        output: ifconfig -a output
+
+    Returns:
+        Dictionary mapping interface names to InterfaceInfo objects
+    """
+    interfaces = {}
+    name = None
+    block_lines = []
+
+    for line in output.splitlines():
+        # Line belonging to current interface
+        if not line or line.startswith(('\t', ' ')):
+            if name:
+                block_lines.append(line)
+            continue
+
+        # Start of another interface (or unrelated text) ends the current block
+        if name:
+            interfaces[name] = _parse_block(name, '\n'.join(block_lines))
+
+        header_match = _INTERFACE_HEADER_RE.match(line)
+        name = header_match.group(1) if header_match else None
+        block_lines = [line]
+
+    if name:
+        interfaces[name] = _parse_block(name, '\n'.join(block_lines))
 
+    return interfaces
+
+
+def _parse_block(interface_name: str, block: str) -> InterfaceInfo:
+    """Parse a single interface block from ifconfig output.
+
+    Args:
+        interface_name: Interface name
+        block: ifconfig lines belonging to the interface
+
+    Returns:
+        InterfaceInfo object
+    """
     # Parse MAC address
-    mac_match = re.search(r'ether\s+([0-9a-f:]+)', block, re.IGNORECASE)
+    mac_match = _MAC_RE.search(block)
     mac_address = mac_match.group(1) if mac_match else ""
 
     # Parse IPv4 address and netmask
-    ipv4_match = re.search(r'inet\s+(\d+\.\d+\.\d+\.\d+)\s+netmask\s+0x([0-9a-f]+)', block)
+    ipv4_match = _IPV4_RE.search(block)
     ipv4_address = None
     netmask = None
     if ipv4_match:
         ipv4_address = ipv4_match.group(1)
         # Convert hex netmask to dotted decimal
         hex_mask = ipv4_match.group(2)
-        netmask = '.'.join(str(int(hex_mask[i:i+2], 16)) for i in range(0, 8, 2))
+        netmask = socket.inet_ntoa(int(hex_mask, 16).to_bytes(4, 'big'))
 
     # Parse IPv6 addresses
-    ipv6_addresses = re.findall(r'inet6\s+([0-9a-f:]+)', block, re.IGNORECASE)
+    ipv6_addresses = _IPV6_RE.findall(block)
 
     # Parse status
-    status_match = re.search(r'status:\s+(\w+)', block)
+    status_match = _STATUS_RE.search(block)
     status = status_match.group(1) if status_match else "unknown"
 
     # Parse media type
-    media_match = re.search(r'media:\s+([^\n]+)', block)
+    media_match = _MEDIA_RE.search(block)
     media_type = media_match.group(1).strip() if media_match else ""
 
     # Parse MTU
-    mtu_match = re.search(r'mtu\s+(\d+)', block)
+    mtu_match = _MTU_RE.search(block)
     mtu = int(mtu_match.group(1)) if mtu_match else 0
 
     return InterfaceInfo(
@@ -77,17 +131,3 @@ def parse_ifconfig(output: str, interface_name: str) -> Optional[InterfaceInfo]:
         media_type=media_type,
         mtu=mtu
     )
-
-
-def parse_all_interfaces(output: str) -> list[str]:
-    """Parse all interface names from ifconfig output.
-
-    Args:
-        output: ifconfig -a output
-
-    Returns:
-        List of interface names
-    """
-    pattern = r'^(\w+\d*):\s+flags='
-    matches = re.findall(pattern, output, re.MULTILINE)
-    return matches
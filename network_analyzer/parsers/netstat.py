@@ -4,6 +4,9 @@ import re
 from typing import Optional
 from network_analyzer.models import NetworkMetrics
 
+_DEFAULT_GATEWAY_RE = re.compile(r'^default\s+(\d+\.\d+\.\d+\.\d+)', re.MULTILINE)
+_ROUTE_HEADER_RE = re.compile(r'Destination\s+Gateway')
+
 
 def parse_netstat_interface(output: str, interface_name: str) -> Optional[NetworkMetrics]:
     """Parse netstat -I output for interface metrics.
@@ -15,30 +18,31 @@ def parse_netstat_interface(output: str, interface_name: str) -> Optional[Networ
     Returns:
         NetworkMetrics object or None if parsing fails
     """
-    lines = output.strip().split('\n')
-
-    # Find the data line (skip header)
-    for line in lines:
-        if line.startswith(interface_name):
-            parts = line.split()
-            if len(parts) >= 10:
-                try:
-                    # netstat -I format:
-                    # Name Mtu Network Address Ipkts Ierrs Ibytes Opkts Oerrs Obytes Coll
-                    return NetworkMetrics(
-                        interface=interface_name,
-                        packets_in=int(parts[4]),
-                        errors_in=int(parts[5]),
-                        bytes_in=int(parts[6]),
-                        packets_out=int(parts[7]),
-                        errors_out=int(parts[8]),
-                        bytes_out=int(parts[9]),
-                        collisions=int(parts[10]) if len(parts) > 10 else 0
-                    )
-                except (ValueError, IndexError):
-                    pass
-
-    return None
+    # The first line for the interface carries the link-level counters
+    data_line = next(
+        (line for line in output.splitlines() if line.startswith(interface_name)),
+        None
+    )
+    if not data_line:
+        return None
+
+    # Coll is the 11th and last column, no need to split further
+    parts = data_line.split(None, 10)
+    try:
+        # netstat -I format:
+        # Name Mtu Network Address Ipkts Ierrs Ibytes Opkts Oerrs Obytes Coll
+        return NetworkMetrics(
+            interface=interface_name,
+            packets_in=int(parts[4]),
+            errors_in=int(parts[5]),
+            bytes_in=int(parts[6]),
+            packets_out=int(parts[7]),
+            errors_out=int(parts[8]),
+            bytes_out=int(parts[9]),
+            collisions=int(parts[10]) if len(parts) > 10 else 0
+        )
+    except (ValueError, IndexError):
+        return None
 
 
 def parse_routing_table(output: str) -> list[dict]:
@@ -51,28 +55,30 @@ def parse_routing_table(output: str) -> list[dict]:
         List of route entries
     """
     routes = []
-    lines = output.strip().split('\n')
+    lines = iter(output.splitlines())
+
+    # Skip header lines up to and including the IPv4 column header
+    for line in lines:
+        if _ROUTE_HEADER_RE.match(line):
+            break
 
-    # Skip header lines
-    in_ipv4 = False
     for line in lines:
-        if 'Destination' in line and 'Gateway' in line:
-            in_ipv4 = True
+        if not line:
             continue
 
-        if in_ipv4 and line.strip():
-            # Stop at IPv6 section
-            if 'Internet6' in line:
-                break
+        # Stop at IPv6 section
+        if line.startswith('Internet6'):
+            break
 
-            parts = line.split()
-            if len(parts) >= 4:
-                routes.append({
-                    'destination': parts[0],
-                    'gateway': parts[1],
-                    'flags': parts[2],
-                    'interface': parts[3] if len(parts) > 3 else ''
-                })
+        # Split off the first four columns; the rest (Expire etc.) stays joined
+        parts = line.split(None, 4)
+        if len(parts) >= 4:
+            routes.append({
+                'destination': parts[0],
+                'gateway': parts[1],
+                'flags': parts[2],
+                'interface': parts[3]
+            })
 
     return routes
 
@@ -86,6 +92,5 @@ def get_default_gateway(output: str) -> Optional[str]:
     Returns:
         Default gateway IP or None
     """
-    pattern = r'^default\s+(\d+\.\d+\.\d+\.\d+)'
-    match = re.search(pattern, output, re.MULTILINE)
+    match = _DEFAULT_GATEWAY_RE.search(output)
     return match.group(1) if match else None
@@ -1,8 +1,11 @@
 """Parser for system_profiler command output."""
 
+import functools
 import re
 from typing import Optional
 
+_NAMESERVER_RE = re.compile(r'nameserver\[\d+\]\s*:\s*(\d+\.\d+\.\d+\.\d+)')
+
 
 def parse_hardware_port_mapping(output: str) -> dict[str, str]:
     """Parse system_profiler or networksetup to map interfaces to hardware ports.
@@ -13,11 +16,23 @@ def parse_hardware_port_mapping(output: str) -> dict[str, str]:
     Returns:
         Dictionary mapping interface names to hardware port names
     """
-    mapping = {}
-    lines = output.strip().split('\n')
+    # Copy so callers can't modify the cached mapping
+    return dict(_parse_hardware_port_mapping(output))
+
 
+@functools.lru_cache(maxsize=8)
+def _parse_hardware_port_mapping(output: str) -> dict[str, str]:
+    """Parse networksetup output, caching the result per output string.
+
+    Args:
+        output: networksetup -listallhardwareports output
+
+    Returns:
+        Dictionary mapping interface names to hardware port names
+    """
+    mapping = {}
     current_port = None
-    for line in lines:
+    for line in output.splitlines():
         line = line.strip()
 
         if line.startswith('Hardware Port:'):
@@ -40,8 +55,7 @@ def parse_dns_servers(output: str) -> list[str]:
         List of DNS server IPs
     """
     dns_servers = []
-    pattern = r'nameserver\[\d+\]\s*:\s*(\d+\.\d+\.\d+\.\d+)'
-    matches = re.findall(pattern, output)
+    matches = _NAMESERVER_RE.findall(output)
 
     # Return unique DNS servers
     return list(dict.fromkeys(matches))
@@ -1,28 +1,129 @@
 """Utility functions for network analysis."""
 
+import asyncio
+import functools
+import os
+import platform
+import re
+import shutil
+import socket
+import struct
 import subprocess
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Literal, NamedTuple, Optional, Sequence, Union, overload
+from network_analyzer.models import (
+    HealthStatus,
+    InterfaceInfo,
+    NetworkMetrics,
+    PingResult,
+    SpeedTestResult,
+    WiFiInfo
+)
+from network_analyzer.parsers.airport import parse_airport_fields
 
 logger = logging.getLogger(__name__)
 
+# Cached command results: command tuple -> (expiry time, result)
+_command_cache: dict[tuple[str, ...], tuple[float, tuple[str, str, int]]] = {}
+
+# Per-command locks so concurrent callers share one run of a command
+_command_locks: dict[tuple[str, ...], threading.Lock] = {}
+_command_locks_guard = threading.Lock()
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# WiFi standards older than 802.11n (WiFi 4)
+_OLD_WIFI_RE = re.compile(r'802\.11[bg]')
+
+AIRPORT_PATH = (
+    "/System/Library/PrivateFrameworks/Apple80211.framework/"
+    "Versions/Current/Resources/airport"
+)
+
+# airport -I command, or None if airport is not installed (it was
+# removed in newer macOS releases)
+_AIRPORT_ARGV = (AIRPORT_PATH, "-I") if os.access(AIRPORT_PATH, os.X_OK) else None
+
+# Internet reachability probes
+_SCUTIL_ARGV = ("scutil", "-r", "8.8.8.8")
+_PING_ARGV = ("ping", "-c", "1", "-W", "2", "8.8.8.8")
+
+# Seconds an airport -I snapshot is reused
+_WIFI_SNAPSHOT_TTL = 1
+
+# Seconds before an interface is probed for WiFi again
+_WIFI_CHECK_TTL = 60
+
+# WiFi interface checks: interface name -> (expiry time, result)
+_wifi_interface_cache: dict[str, tuple[float, bool]] = {}
+
 
 class CommandExecutionError(Exception):
     """Exception raised when command execution fails."""
     pass
 
 
+class _CommandLine:
+    """Command argv that is only joined into a string when logged."""
+
+    __slots__ = ('cmd',)
+
+    def __init__(self, cmd: Sequence[str]):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return ' '.join(self.cmd)
+
+
+@functools.lru_cache(maxsize=32)
+def resolve_executable(name: str) -> str:
+    """Resolve a command name to its absolute path.
+
+    Args:
+        name: Command name or path
+
+    Returns:
+        Absolute path, or the name unchanged if it can't be found on PATH
+    """
+    return shutil.which(name) or name
+
+
+@overload
+def execute_command(
+    cmd: Sequence[str],
+    timeout: int = ...,
+    check_return_code: bool = ...,
+    text: Literal[True] = ...
+) -> tuple[str, str, int]: ...
+
+
+@overload
+def execute_command(
+    cmd: Sequence[str],
+    timeout: int = ...,
+    check_return_code: bool = ...,
+    *,
+    text: Literal[False]
+) -> tuple[bytes, bytes, int]: ...
+
+
 def execute_command(
-    cmd: list[str],
+    cmd: Sequence[str],
     timeout: int = 10,
-    check_return_code: bool = False
-) -> tuple[str, str, int]:
+    check_return_code: bool = False,
+    text: bool = True
+) -> tuple[Union[str, bytes], Union[str, bytes], int]:
     """Execute system command with timeout and error handling.
 
     Args:
         cmd: Command and arguments as list
         timeout: Timeout in seconds
         check_return_code: Raise exception on non-zero return code
+        text: Decode output to str; pass False to get raw bytes when only
+            checking for markers in the output
 
     Returns:
         Tuple of (stdout, stderr, returncode)
@@ -31,81 +132,272 @@ def execute_command(
         CommandExecutionError: On timeout or command not found
     """
     try:
+        # An absolute path and close_fds=False let CPython start the child
+        # with posix_spawn instead of fork+exec. Python opens file descriptors
+        # non-inheritable (PEP 446), so nothing extra leaks into the child.
         result = subprocess.run(
-            cmd,
+            [resolve_executable(cmd[0]), *cmd[1:]],
             capture_output=True,
-            text=True,
+            text=text,
             timeout=timeout,
-            check=False
+            check=False,
+            close_fds=False
         )
 
         if check_return_code and result.returncode != 0:
+            stderr = result.stderr if text else result.stderr.decode('utf-8', 'replace')
             raise CommandExecutionError(
                 f"Command failed: {' '.join(cmd)}\n"
                 f"Return code: {result.returncode}\n"
-                f"stderr: {result.stderr}"
+                f"stderr: {stderr}"
             )
 
         return result.stdout, result.stderr, result.returncode
 
     except subprocess.TimeoutExpired:
-        logger.error(f"Command timed out after {timeout}s: {' '.join(cmd)}")
+        logger.error("Command timed out after %ss: %s", timeout, _CommandLine(cmd))
         raise CommandExecutionError(f"Command timed out: {' '.join(cmd)}")
     except FileNotFoundError:
-        logger.error(f"Command not found: {cmd[0]}")
+        logger.error("Command not found: %s", cmd[0])
         raise CommandExecutionError(f"Command not found: {cmd[0]}")
     except Exception as e:
-        logger.error(f"Unexpected error executing {' '.join(cmd)}: {e}")
+        logger.error("Unexpected error executing %s: %s", _CommandLine(cmd), e)
         raise CommandExecutionError(f"Failed to execute command: {e}")
 
 
+def execute_cached_command(
+    cmd: Sequence[str],
+    ttl: float,
+    timeout: int = 10
+) -> tuple[str, str, int]:
+    """Execute system command, reusing a recent result for the same command.
+
+    Intended for commands whose output changes rarely (hardware ports, DNS
+    configuration, ARP cache) but which may be queried on every poll. Only
+    successful results (return code 0) are cached. Concurrent callers wait
+    for a single run of the command instead of each starting their own.
+
+    Args:
+        cmd: Command and arguments as list
+        ttl: Seconds a result stays valid
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (stdout, stderr, returncode)
+
+    Raises:
+        CommandExecutionError: On timeout or command not found
+    """
+    key = tuple(cmd)
+
+    cached = _command_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    with _command_locks_guard:
+        lock = _command_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        # Another thread may have run the command while this one waited
+        now = time.monotonic()
+        cached = _command_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        result = execute_command(cmd, timeout=timeout)
+        # Don't let a transient failure hide the real output for a whole TTL
+        if result[2] == 0:
+            _command_cache[key] = (now + ttl, result)
+        return result
+
+
+def get_wifi_snapshot(interface: str) -> dict[str, str]:
+    """Get the parsed airport -I fields for the current WiFi connection.
+
+    The airport output is cached for _WIFI_SNAPSHOT_TTL seconds, so the
+    WiFi check and the WiFi info collector share a single airport run.
+
+    Args:
+        interface: Interface name (e.g., 'en0')
+
+    Returns:
+        Dictionary of airport fields, empty if airport is unavailable
+    """
+    if _AIRPORT_ARGV is None:
+        return {}
+
+    try:
+        stdout, _, code = execute_cached_command(_AIRPORT_ARGV, ttl=_WIFI_SNAPSHOT_TTL, timeout=10)
+    except Exception:
+        return {}
+
+    return parse_airport_fields(stdout) if code == 0 else {}
+
+
 def is_wifi_interface(interface: str) -> bool:
     """Check if interface is WiFi.
 
+    Results are cached for _WIFI_CHECK_TTL seconds, so an interface that
+    changes state is eventually probed again.
+
     Args:
         interface: Interface name (e.g., 'en0')
 
     Returns:
         True if WiFi interface, False otherwise
     """
-    try:
-        airport_cmd = [
-            "/System/Library/PrivateFrameworks/Apple80211.framework/"
-            "Versions/Current/Resources/airport",
-            "-I"
-        ]
-        stdout, _, code = execute_command(airport_cmd, timeout=5)
-        return code == 0 and "agrCtlRSSI" in stdout
-    except Exception:
+    if _AIRPORT_ARGV is None:
         return False
 
+    now = time.monotonic()
+    cached = _wifi_interface_cache.get(interface)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    result = 'agrCtlRSSI' in get_wifi_snapshot(interface)
+
+    _wifi_interface_cache[interface] = (now + _WIFI_CHECK_TTL, result)
+    return result
 
-def check_internet_connectivity() -> bool:
-    """Check if internet is available.
+
+async def _run_probe(cmd: Sequence[str], timeout: float) -> tuple[bytes, int]:
+    """Run a probe command, killing it if cancelled or timed out.
+
+    Args:
+        cmd: Command and arguments as list
+        timeout: Timeout in seconds
 
     Returns:
-        True if internet is reachable, False otherwise
+        Tuple of (stdout, returncode)
     """
-    # Method 1: scutil reachability
+    process = await asyncio.create_subprocess_exec(
+        resolve_executable(cmd[0]), *cmd[1:],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        close_fds=False
+    )
     try:
-        stdout, _, code = execute_command(
-            ["scutil", "-r", "8.8.8.8"],
-            timeout=5
-        )
-        if code == 0 and "Reachable" in stdout:
-            return True
-    except Exception:
-        pass
+        async with asyncio.timeout(timeout):
+            stdout, _ = await process.communicate()
+        # communicate() waits for the process to exit
+        assert process.returncode is not None
+        return stdout, process.returncode
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 internet checksum of an ICMP message."""
+    if len(data) % 2:
+        data += b'\0'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
 
-    # Method 2: ping fallback
+async def _icmp_probe(host: str, timeout: float = 1.0) -> bool:
+    """Send a single ICMP echo request without spawning ping.
+
+    Uses an unprivileged ICMP datagram socket, which macOS allows by
+    default and Linux allows for groups in net.ipv4.ping_group_range.
+
+    Args:
+        host: IPv4 address to probe
+        timeout: Seconds to wait for the echo reply
+
+    Returns:
+        True if an echo reply arrived in time, False otherwise
+
+    Raises:
+        PermissionError: If unprivileged ICMP sockets are not permitted
+    """
+    ident = os.getpid() & 0xFFFF
+    checksum = _icmp_checksum(struct.pack('!BBHHH', 8, 0, 0, ident, 1))
+    packet = struct.pack('!BBHHH', 8, 0, checksum, ident, 1)
+
+    loop = asyncio.get_running_loop()
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+        sock.setblocking(False)
+        try:
+            async with asyncio.timeout(timeout):
+                await loop.sock_sendto(sock, packet, (host, 0))
+                while True:
+                    reply, (source, _) = await loop.sock_recvfrom(sock, 1024)
+                    if source != host:
+                        continue
+
+                    # macOS includes the IPv4 header and delivers every ICMP
+                    # packet on the host, so the identifier must match too.
+                    # Linux strips the header, rewrites the identifier and
+                    # only delivers replies to this socket.
+                    check_ident = bool(reply) and reply[0] >> 4 == 4
+                    if check_ident:
+                        reply = reply[(reply[0] & 0x0F) * 4:]
+
+                    if (len(reply) >= 8 and reply[0] == 0
+                            and reply[6:8] == packet[6:8]
+                            and (not check_ident or reply[4:6] == packet[4:6])):
+                        return True
+        except TimeoutError:
+            return False
+
+
+async def _scutil_reachable() -> bool:
+    """Check reachability of 8.8.8.8 via scutil."""
+    stdout, code = await _run_probe(_SCUTIL_ARGV, timeout=5)
+    return code == 0 and b"Reachable" in stdout
+
+
+async def _ping_reachable() -> bool:
+    """Check reachability of 8.8.8.8 via a single ICMP echo.
+
+    Falls back to the ping command if ICMP sockets are not permitted.
+    """
     try:
-        _, _, code = execute_command(
-            ["ping", "-c", "1", "-W", "2", "8.8.8.8"],
-            timeout=5
-        )
+        return await _icmp_probe("8.8.8.8", timeout=2)
+    except PermissionError:
+        _, code = await _run_probe(_PING_ARGV, timeout=5)
         return code == 0
-    except Exception:
+
+
+async def _check_internet_connectivity_async() -> bool:
+    """Run all reachability probes concurrently.
+
+    Returns:
+        True as soon as any probe reports the internet reachable
+    """
+    probes = [
+        asyncio.create_task(_scutil_reachable()),
+        asyncio.create_task(_ping_reachable())
+    ]
+    try:
+        for probe in asyncio.as_completed(probes):
+            try:
+                if await probe:
+                    return True
+            except Exception:
+                continue
         return False
+    finally:
+        # Stop the probe still running (this kills its process)
+        for probe in probes:
+            probe.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+
+
+def check_internet_connectivity() -> bool:
+    """Check if internet is available.
+
+    Runs scutil reachability and a ping concurrently and returns as soon
+    as either succeeds.
+
+    Returns:
+        True if internet is reachable, False otherwise
+    """
+    return asyncio.run(_check_internet_connectivity_async())
 
 
 def format_bytes(bytes_count: int) -> str:
@@ -117,11 +409,10 @@ def format_bytes(bytes_count: int) -> str:
     Returns:
         Formatted string (e.g., '1.5 GB')
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.1f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.1f} PB"
+    # Each unit is 2**10 times the previous one, so bit_length picks it directly
+    count = int(bytes_count)
+    index = 0 if count <= 0 else min((count.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
 
 
 def calculate_error_rate(errors: int, total_packets: int) -> float:
@@ -139,22 +430,36 @@ def calculate_error_rate(errors: int, total_packets: int) -> float:
     return (errors / total_packets) * 100
 
 
+@functools.lru_cache(maxsize=1)
 def get_macos_version() -> Optional[tuple[int, int, int]]:
     """Get macOS version.
 
+    Reads the version in-process via platform.mac_ver() and only falls back
+    to sw_vers if that comes back empty. The result is cached since the OS
+    version can't change while running.
+
     Returns:
         Tuple of (major, minor, patch) or None if unable to determine
     """
+    version = platform.mac_ver()[0]
+
+    if not version:
+        try:
+            stdout, _, code = execute_command(["sw_vers", "-productVersion"], timeout=5)
+            if code == 0:
+                version = stdout.strip()
+        except Exception:
+            pass
+
     try:
-        stdout, _, code = execute_command(["sw_vers", "-productVersion"], timeout=5)
-        if code == 0:
-            parts = stdout.strip().split('.')
-            return tuple(int(p) for p in parts)
-    except Exception:
+        if version:
+            return tuple(int(p) for p in version.split('.'))
+    except ValueError:
         pass
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def supports_network_quality() -> bool:
     """Check if networkQuality command is available (macOS 12.1+).
 
@@ -169,13 +474,202 @@ def supports_network_quality() -> bool:
     return major > 12 or (major == 12 and minor >= 1)
 
 
+def gather_health_inputs(
+    interface: str,
+    hosts: list[str],
+    include_speed_test: bool = False,
+    ping_count: int = 10
+) -> tuple[Optional[NetworkMetrics], Optional[WiFiInfo], list[PingResult], Optional[SpeedTestResult]]:
+    """Collect the inputs for assess_network_health concurrently.
+
+    The probes (netstat/psutil counters, airport and one ping per host) are
+    independent, so running them on a thread pool makes the total time that
+    of the slowest probe. The optional networkQuality speed test saturates
+    the link, so it only starts once every ping has finished.
+
+    Args:
+        interface: Interface name
+        hosts: Hosts to ping
+        include_speed_test: Whether to run the networkQuality speed test
+        ping_count: Number of pings per host
+
+    Returns:
+        Tuple of (metrics, wifi_info, ping_results, speed_result)
+    """
+    from network_analyzer.collectors.offline import (
+        get_interface_metrics,
+        get_wifi_info,
+        run_ping_test
+    )
+    from network_analyzer.collectors.online import run_speed_test
+
+    with ThreadPoolExecutor(max_workers=len(hosts) + 2) as executor:
+        metrics_future = executor.submit(get_interface_metrics, interface)
+        wifi_future = executor.submit(get_wifi_info, interface)
+        ping_futures = [executor.submit(run_ping_test, host, ping_count) for host in hosts]
+
+        ping_results = [result for result in (f.result() for f in ping_futures) if result]
+
+        # Pings running during the speed test would measure a loaded link
+        speed_result = run_speed_test(interface) if include_speed_test else None
+
+        return (
+            metrics_future.result(),
+            wifi_future.result(),
+            ping_results,
+            speed_result
+        )
+
+
+class _TrafficStats(NamedTuple):
+    """Packet totals checked by the traffic health rules."""
+    packets: int
+    errors: int
+    collisions: int
+
+    @property
+    def error_rate(self) -> float:
+        return calculate_error_rate(self.errors, self.packets)
+
+
+# Health rules: (predicate, deduction, severity, message, recommendation).
+# Rules are grouped into tuples; only the first matching rule of a group
+# applies. Messages are str.format templates applied to the checked object.
+_Rule = tuple[Callable[[Any], object], int, str, str, Optional[str]]
+_RuleTable = tuple[tuple[_Rule, ...], ...]
+
+_INTERFACE_RULES: _RuleTable = (
+    ((lambda i: i.status != "active", 50, 'error',
+      "Interface is not active",
+      "Check interface configuration and ensure it's enabled"),),
+)
+
+# Rates are compared by cross-multiplying; the percentage is only
+# computed when a message is formatted. Collisions are only known for
+# interfaces read through netstat (psutil doesn't expose them), so the
+# collision rule doesn't fire for interfaces psutil reports.
+_TRAFFIC_RULES: _RuleTable = (
+    ((lambda t: t.errors * 100 > t.packets, 20, 'error',
+      "High error rate: {0.error_rate:.2f}%",
+      "Check network cables or WiFi signal strength"),
+     (lambda t: t.errors * 1000 > t.packets, 10, 'warning',
+      "Moderate error rate: {0.error_rate:.2f}%",
+      None)),
+    ((lambda t: t.collisions * 100 > t.packets, 5, 'warning',
+      "High collision rate detected",
+      "Network may be congested"),),
+)
+
+_WIFI_RULES: _RuleTable = (
+    ((lambda w: w.rssi < -80, 20, 'error',
+      "Very weak WiFi signal: {0.rssi} dBm",
+      "Move closer to access point or use 5GHz band"),
+     (lambda w: w.rssi < -70, 10, 'warning',
+      "Weak WiFi signal: {0.rssi} dBm",
+      "Consider moving closer to access point"),
+     (lambda w: w.rssi < -60, 5, 'warning',
+      "Fair WiFi signal: {0.rssi} dBm",
+      None)),
+    ((lambda w: w.snr < 20, 15, 'error',
+      "Poor signal-to-noise ratio: {0.snr} dB",
+      "High interference detected, try changing WiFi channel"),
+     (lambda w: w.snr < 30, 5, 'warning',
+      "Low signal-to-noise ratio: {0.snr} dB",
+      None)),
+    ((lambda w: w.phy_mode and _OLD_WIFI_RE.search(w.phy_mode), 0, 'warning',
+      "Using older WiFi standard: {0.phy_mode}",
+      "Upgrade to WiFi 5 (802.11ac) or WiFi 6 (802.11ax)"),),
+    ((lambda w: w.channel_width and w.channel_width < 40 and w.band == "5GHz", 0, 'warning',
+      "Using narrow channel width: {0.channel_width}MHz on 5GHz",
+      "Configure router for 80MHz or 160MHz channel width"),),
+)
+
+_PING_RULES: _RuleTable = (
+    ((lambda p: p.packet_loss > 5.0, 15, 'error',
+      "High packet loss to {0.host}: {0.packet_loss:.1f}%",
+      "Check network stability and internet connection"),
+     (lambda p: p.packet_loss > 1.0, 5, 'warning',
+      "Moderate packet loss to {0.host}: {0.packet_loss:.1f}%",
+      None)),
+    ((lambda p: p.avg_rtt > 100, 10, 'warning',
+      "High latency to {0.host}: {0.avg_rtt:.1f} ms",
+      "Check for network congestion or bandwidth issues"),),
+    ((lambda p: p.jitter > 20, 10, 'warning',
+      "High jitter to {0.host}: {0.jitter:.1f} ms",
+      "Network instability detected, may affect VoIP and gaming"),
+     (lambda p: p.jitter > 10, 5, 'warning',
+      "Moderate jitter to {0.host}: {0.jitter:.1f} ms",
+      None)),
+)
+
+_SPEED_RULES: _RuleTable = (
+    ((lambda s: s.download_mbps < 10, 10, 'warning',
+      "Slow download speed: {0.download_mbps:.1f} Mbps",
+      "Contact ISP or check for bandwidth throttling"),),
+    ((lambda s: s.upload_mbps < 5, 5, 'warning',
+      "Slow upload speed: {0.upload_mbps:.1f} Mbps",
+      None),),
+)
+
+
+def _apply_rules(
+    rules: _RuleTable,
+    subject: object,
+    errors: list[str],
+    warnings: list[str],
+    recommendations: list[str]
+) -> int:
+    """Evaluate a health rule table against one object.
+
+    Args:
+        rules: Rule groups, e.g. _WIFI_RULES
+        subject: Object the rule predicates and messages are applied to
+        errors: List that error messages are appended to
+        warnings: List that warning messages are appended to
+        recommendations: List that recommendations are appended to
+
+    Returns:
+        Total score deduction of the matching rules
+    """
+    deduction = 0
+    for group in rules:
+        for predicate, points, severity, message, recommendation in group:
+            if predicate(subject):
+                deduction += points
+                (errors if severity == 'error' else warnings).append(message.format(subject))
+                if recommendation:
+                    recommendations.append(recommendation)
+                break
+    return deduction
+
+
+def _rule_deduction(rules: _RuleTable, subject: object) -> int:
+    """Compute the score deduction of a health rule table without messages.
+
+    Args:
+        rules: Rule groups, e.g. _WIFI_RULES
+        subject: Object the rule predicates are applied to
+
+    Returns:
+        Total score deduction of the matching rules
+    """
+    deduction = 0
+    for group in rules:
+        for predicate, points, _, _, _ in group:
+            if predicate(subject):
+                deduction += points
+                break
+    return deduction
+
+
 def assess_network_health(
-    interface_info,
-    metrics,
-    wifi_info=None,
-    ping_results=None,
-    speed_result=None
-) -> 'HealthStatus':
+    interface_info: InterfaceInfo,
+    metrics: Optional[NetworkMetrics],
+    wifi_info: Optional[WiFiInfo] = None,
+    ping_results: Optional[list[PingResult]] = None,
+    speed_result: Optional[SpeedTestResult] = None,
+    fast_mode: bool = False
+) -> HealthStatus:
     """Assess overall network health.
 
     Args:
@@ -184,110 +678,52 @@ def assess_network_health(
         wifi_info: Optional WiFiInfo object
         ping_results: Optional list of PingResult objects
         speed_result: Optional SpeedTestResult object
+        fast_mode: Only compute the score; warnings, errors and
+            recommendations are left empty
 
     Returns:
         HealthStatus object
     """
-    from network_analyzer.models import HealthStatus
-
     score = 100
-    warnings = []
-    errors = []
-    recommendations = []
+    warnings: list[str] = []
+    errors: list[str] = []
+    recommendations: list[str] = []
 
-    # Check interface status
-    if interface_info.status != "active":
-        score -= 50
-        errors.append("Interface is not active")
-        recommendations.append("Check interface configuration and ensure it's enabled")
+    # (rule table, checked object) pairs, in the order messages are reported
+    checks: list[tuple[_RuleTable, object]] = [(_INTERFACE_RULES, interface_info)]
 
     # Check for errors
     if metrics:
         total_packets = metrics.packets_in + metrics.packets_out
         if total_packets > 0:
-            error_rate = (metrics.errors_in + metrics.errors_out) / total_packets * 100
-
-            if error_rate > 1.0:
-                score -= 20
-                errors.append(f"High error rate: {error_rate:.2f}%")
-                recommendations.append("Check network cables or WiFi signal strength")
-            elif error_rate > 0.1:
-                score -= 10
-                warnings.append(f"Moderate error rate: {error_rate:.2f}%")
-
-            if metrics.collisions > total_packets * 0.01:
-                score -= 5
-                warnings.append("High collision rate detected")
-                recommendations.append("Network may be congested")
+            traffic = _TrafficStats(
+                packets=total_packets,
+                errors=metrics.errors_in + metrics.errors_out,
+                collisions=metrics.collisions
+            )
+            checks.append((_TRAFFIC_RULES, traffic))
 
     # Check WiFi signal quality
     if wifi_info:
-        if wifi_info.rssi < -80:
-            score -= 20
-            errors.append(f"Very weak WiFi signal: {wifi_info.rssi} dBm")
-            recommendations.append("Move closer to access point or use 5GHz band")
-        elif wifi_info.rssi < -70:
-            score -= 10
-            warnings.append(f"Weak WiFi signal: {wifi_info.rssi} dBm")
-            recommendations.append("Consider moving closer to access point")
-        elif wifi_info.rssi < -60:
-            score -= 5
-            warnings.append(f"Fair WiFi signal: {wifi_info.rssi} dBm")
-
-        # Check SNR
-        if wifi_info.snr < 20:
-            score -= 15
-            errors.append(f"Poor signal-to-noise ratio: {wifi_info.snr} dB")
-            recommendations.append("High interference detected, try changing WiFi channel")
-        elif wifi_info.snr < 30:
-            score -= 5
-            warnings.append(f"Low signal-to-noise ratio: {wifi_info.snr} dB")
-
-        # Check WiFi standard
-        if wifi_info.phy_mode:
-            if '802.11b' in wifi_info.phy_mode or '802.11g' in wifi_info.phy_mode:
-                warnings.append(f"Using older WiFi standard: {wifi_info.phy_mode}")
-                recommendations.append("Upgrade to WiFi 5 (802.11ac) or WiFi 6 (802.11ax)")
-
-        # Check channel width
-        if wifi_info.channel_width and wifi_info.channel_width < 40 and wifi_info.band == "5GHz":
-            warnings.append(f"Using narrow channel width: {wifi_info.channel_width}MHz on 5GHz")
-            recommendations.append("Configure router for 80MHz or 160MHz channel width")
+        checks.append((_WIFI_RULES, wifi_info))
 
     # Check ping results
     if ping_results:
-        for result in ping_results:
-            if result.packet_loss > 5.0:
-                score -= 15
-                errors.append(f"High packet loss to {result.host}: {result.packet_loss:.1f}%")
-                recommendations.append("Check network stability and internet connection")
-            elif result.packet_loss > 1.0:
-                score -= 5
-                warnings.append(f"Moderate packet loss to {result.host}: {result.packet_loss:.1f}%")
-
-            if result.avg_rtt > 100:
-                score -= 10
-                warnings.append(f"High latency to {result.host}: {result.avg_rtt:.1f} ms")
-                recommendations.append("Check for network congestion or bandwidth issues")
-
-            if result.jitter > 20:
-                score -= 10
-                warnings.append(f"High jitter to {result.host}: {result.jitter:.1f} ms")
-                recommendations.append("Network instability detected, may affect VoIP and gaming")
-            elif result.jitter > 10:
-                score -= 5
-                warnings.append(f"Moderate jitter to {result.host}: {result.jitter:.1f} ms")
+        checks.extend((_PING_RULES, result) for result in ping_results)
 
     # Check speed test results
     if speed_result:
-        if speed_result.download_mbps < 10:
-            score -= 10
-            warnings.append(f"Slow download speed: {speed_result.download_mbps:.1f} Mbps")
-            recommendations.append("Contact ISP or check for bandwidth throttling")
-
-        if speed_result.upload_mbps < 5:
-            score -= 5
-            warnings.append(f"Slow upload speed: {speed_result.upload_mbps:.1f} Mbps")
+        checks.append((_SPEED_RULES, speed_result))
+
+    if fast_mode:
+        for rules, subject in checks:
+            score -= _rule_deduction(rules, subject)
+            # Deductions only lower the score, so it stays clamped at 0
+            if score <= 0:
+                break
+    else:
+        for rules, subject in checks:
+            score -= _apply_rules(rules, subject, errors, warnings, recommendations)
 
     # Ensure score doesn't go below 0
     score = max(0, score)